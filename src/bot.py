@@ -1,50 +1,84 @@
 import asyncio
-import json
 import logging
 import os
-import re
+import random
+import string
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import aiohttp
+import aiosqlite
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
-UUID_REGEX = re.compile(
-    r"^[0-9a-fA-F]{32}$|^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-"
-    r"[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-)
-
-
-@dataclass(frozen=True)
+NAME_CACHE_TTL_SECONDS = 24 * 60 * 60
+NAME_CACHE_MISS_TTL_SECONDS = 5 * 60
+NAME_CACHE_MAX_ENTRIES = 10_000
+STATUS_CACHE_TTL_SECONDS = 30
+MOJANG_BATCH_SIZE = 10
+MOJANG_BATCH_DELAY_SECONDS = 0.05
+PLAYER_NAME_MAX_LENGTH = 25
+PLAYER_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError)
+STATUS_FETCH_ATTEMPTS = 2
+STATUS_RETRY_DELAY_SECONDS = (0.1, 0.3)
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_OPEN_SECONDS = 60
+USER_AGENT = "cristian-mc-bot/1.0"
+
+logger = logging.getLogger("cristian-minecraft-bot")
+
+
+@dataclass(frozen=True, slots=True)
 class ServerTarget:
     name: str
     address: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     token: str
     servers: list[ServerTarget]
     request_timeout_seconds: int = 10
     max_concurrency: int = 8
+    stop_on_first_match: bool = False
+    name_cache_path: str = "mojang_cache.db"
+
+
+@dataclass(frozen=True, slots=True)
+class ServerStatus:
+    online: bool
+    names: frozenset[str]
+    uuids: frozenset[str]
 
 
 def load_config(path: str) -> BotConfig:
-    if not os.path.exists(path):
+    try:
+        with open(path, "rb") as handle:
+            raw = orjson.loads(handle.read())
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Arquivo de configuracao nao encontrado: {path}. "
             "Copie config.example.json para config.json e ajuste as informacoes."
-        )
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+        ) from None
     servers_raw = raw.get("servers", [])
-    servers = [
-        ServerTarget(name=entry["name"], address=entry["address"])
-        for entry in servers_raw
-        if isinstance(entry, dict) and entry.get("name") and entry.get("address")
-    ]
+    servers = []
+    seen_addresses = set()
+    for entry in servers_raw:
+        if not (isinstance(entry, dict) and entry.get("name") and entry.get("address")):
+            continue
+        address_key = entry["address"].lower()
+        if address_key in seen_addresses:
+            logger.warning(
+                "Servidor duplicado ignorado: %s (%s)", entry["name"], entry["address"]
+            )
+            continue
+        seen_addresses.add(address_key)
+        servers.append(ServerTarget(name=entry["name"], address=entry["address"]))
     token = raw.get("discord_token")
     if not token:
         raise ValueError("Campo 'discord_token' ausente no config.json.")
@@ -56,6 +90,8 @@ def load_config(path: str) -> BotConfig:
         servers=servers,
         request_timeout_seconds=raw.get("request_timeout_seconds", 10),
         max_concurrency=max_concurrency,
+        stop_on_first_match=raw.get("stop_on_first_match") is True,
+        name_cache_path=raw.get("name_cache_path") or "mojang_cache.db",
     )
 
 
@@ -63,22 +99,53 @@ def normalize_uuid(value: str) -> str:
     return value.replace("-", "").lower()
 
 
-async def fetch_json(session: aiohttp.ClientSession, url: str) -> dict[str, Any]:
-    async with session.get(url) as response:
-        response.raise_for_status()
-        return await response.json()
+def is_uuid(value: str) -> bool:
+    if len(value) == 36:
+        if value[8] != "-" or value[13] != "-" or value[18] != "-" or value[23] != "-":
+            return False
+        value = value.replace("-", "")
+    if len(value) != 32:
+        return False
+    try:
+        return len(bytes.fromhex(value)) == 16
+    except ValueError:
+        return False
 
 
-async def fetch_uuid_for_name(
-    session: aiohttp.ClientSession, name: str
-) -> Optional[str]:
-    url = f"https://api.mojang.com/users/profiles/minecraft/{name}"
+def is_player_name(value: str) -> bool:
+    if not 0 < len(value) <= PLAYER_NAME_MAX_LENGTH:
+        return False
+    return PLAYER_NAME_CHARS.issuperset(value)
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    return orjson.loads(await response.read())
+
+
+async def fetch_json(session: aiohttp.ClientSession, url: str) -> dict[str, Any]:
     async with session.get(url) as response:
-        if response.status == 204:
-            return None
         response.raise_for_status()
-        data = await response.json()
-    return data.get("id")
+        return await read_json(response)
+
+
+async def fetch_uuids_for_names(
+    session: aiohttp.ClientSession, names: list[str]
+) -> dict[str, str]:
+    url = "https://api.mojang.com/profiles/minecraft"
+    async with session.post(
+        url,
+        data=orjson.dumps(names),
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        response.raise_for_status()
+        profiles = await read_json(response)
+    if not isinstance(profiles, list):
+        raise ValueError("Resposta inesperada da Mojang: lista de perfis ausente.")
+    return {
+        profile["name"].lower(): profile["id"]
+        for profile in profiles
+        if isinstance(profile, dict) and profile.get("name") and profile.get("id")
+    }
 
 
 async def fetch_server_status(
@@ -88,56 +155,111 @@ async def fetch_server_status(
     return await fetch_json(session, url)
 
 
-def extract_players(payload: dict[str, Any]) -> tuple[list[str], list[str]]:
-    players = payload.get("players", {})
-    names = []
-    for entry in players.get("list") or []:
-        if isinstance(entry, dict):
+def is_transient_error(error: Exception) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return True
+
+
+def extract_players(payload: dict[str, Any]) -> tuple[frozenset[str], frozenset[str]]:
+    players = payload.get("players") or {}
+    names = set()
+    add_name = names.add
+    for entry in players.get("list") or ():
+        entry_type = type(entry)
+        if entry_type is str:
+            add_name(entry.lower())
+        elif entry_type is dict:
             name = entry.get("name")
             if name:
-                names.append(name)
-        elif isinstance(entry, str):
-            names.append(entry)
-    uuids = []
-    for entry in players.get("uuid", []) or []:
-        if isinstance(entry, dict):
-            raw_uuid = entry.get("uuid") or ""
+                add_name(name.lower())
+    uuids = set()
+    add_uuid = uuids.add
+    raw_uuids = players.get("uuid") or ()
+    if type(raw_uuids) is dict:
+        raw_uuids = raw_uuids.values()
+    for entry in raw_uuids:
+        entry_type = type(entry)
+        if entry_type is str:
+            add_uuid(entry.replace("-", "").lower())
+        elif entry_type is dict:
+            raw_uuid = entry.get("uuid")
             if raw_uuid:
-                uuids.append(raw_uuid)
-        elif isinstance(entry, str):
-            uuids.append(entry)
-    return names, uuids
-
-
-async def find_player_servers(
-    session: aiohttp.ClientSession,
-    targets: list[ServerTarget],
-    player_name: str,
-    player_uuid: Optional[str],
-    max_concurrency: int,
+                add_uuid(raw_uuid.replace("-", "").lower())
+    return frozenset(names), frozenset(uuids)
+
+
+def summarize_status(payload: dict[str, Any]) -> ServerStatus:
+    if not payload.get("online"):
+        return ServerStatus(online=False, names=frozenset(), uuids=frozenset())
+    names, uuids = extract_players(payload)
+    return ServerStatus(online=True, names=names, uuids=uuids)
+
+
+def status_has_player(
+    status: ServerStatus, player_name: Optional[str], player_uuid: Optional[str]
+) -> bool:
+    return (player_name is not None and player_name in status.names) or (
+        player_uuid is not None and player_uuid in status.uuids
+    )
+
+
+def servers_with_player(
+    checked: list[tuple[ServerTarget, ServerStatus]], player_uuid: str
 ) -> list[ServerTarget]:
-    matches: list[ServerTarget] = []
-    semaphore = asyncio.Semaphore(max_concurrency)
+    target_uuid = normalize_uuid(player_uuid)
+    return [
+        target
+        for target, status in checked
+        if status_has_player(status, None, target_uuid)
+    ]
+
+
+def server_fields(servers: list[ServerTarget]) -> list[dict[str, Any]]:
+    return [
+        {"name": server.name, "value": f"Endereço: `{server.address}`", "inline": False}
+        for server in servers
+    ]
 
-    async def check_server(target: ServerTarget) -> None:
-        async with semaphore:
-            try:
-                payload = await fetch_server_status(session, target.address)
-            except (aiohttp.ClientError, asyncio.TimeoutError):
-                return
-            if not payload.get("online"):
-                return
-            names, uuids = extract_players(payload)
-            if player_name.lower() in {name.lower() for name in names}:
-                matches.append(target)
-                return
-            if player_uuid:
-                normalized = normalize_uuid(player_uuid)
-                if normalized in {normalize_uuid(uuid) for uuid in uuids}:
-                    matches.append(target)
 
-    await asyncio.gather(*(check_server(target) for target in targets))
-    return matches
+def build_servers_embed(servers: list[ServerTarget]) -> dict[str, Any]:
+    return {
+        "title": "Servidores configurados",
+        "color": discord.Color.blue().value,
+        "fields": server_fields(servers),
+    }
+
+
+class _AdmissionController:
+    def __init__(self, limit: int) -> None:
+        self._condition = asyncio.Condition(asyncio.Lock())
+        self._active = 0
+        self._limit = limit
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            while self._active >= self._limit:
+                await self._condition.wait()
+            self._active += 1
+
+    async def release(self) -> None:
+        await asyncio.shield(self._release_slot())
+
+    async def _release_slot(self) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._condition:
+            grew = limit > self._limit
+            self._limit = limit
+            if grew:
+                self._condition.notify_all()
 
 
 class CristianMinecraftBot(commands.Bot):
@@ -147,13 +269,299 @@ class CristianMinecraftBot(commands.Bot):
         self.config = config
         self.http_timeout = aiohttp.ClientTimeout(total=config.request_timeout_seconds)
         self.http_session: Optional[aiohttp.ClientSession] = None
-        self.logger = logging.getLogger("cristian-minecraft-bot")
+        self.logger = logger
+        self._name_cache: OrderedDict[str, tuple[float, Optional[str]]] = OrderedDict()
+        self._name_db: Optional[aiosqlite.Connection] = None
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._pending_name_resolutions: dict[str, asyncio.Future[Optional[str]]] = {}
+        self._name_flush_timer: Optional[asyncio.TimerHandle] = None
+        self._status_cache: dict[str, tuple[float, ServerStatus]] = {}
+        self._status_locks: dict[str, asyncio.Lock] = {}
+        self._breaker_state: dict[str, tuple[int, float]] = {}
+        self._admission = _AdmissionController(config.max_concurrency)
+        self.servers_embed = build_servers_embed(config.servers)
+
+    async def reload_config(self, path: str) -> BotConfig:
+        config = await asyncio.to_thread(load_config, path)
+        self.config = config
+        self.servers_embed = build_servers_embed(config.servers)
+        await self._admission.set_limit(config.max_concurrency)
+        return config
+
+    def _cached_name(self, key: str) -> Optional[tuple[float, Optional[str]]]:
+        cached = self._name_cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del self._name_cache[key]
+            return None
+        self._name_cache.move_to_end(key)
+        return cached
+
+    def cached_uuid(self, name: str) -> tuple[bool, Optional[str]]:
+        cached = self._cached_name(name.lower())
+        if cached is not None:
+            return True, cached[1]
+        if not is_player_name(name):
+            return True, None
+        return False, None
+
+    async def resolve_uuid(self, name: str) -> Optional[str]:
+        key = name.lower()
+        cached = self._cached_name(key)
+        if cached is not None:
+            return cached[1]
+        persisted = await self._load_persisted_name(key)
+        if persisted is not None:
+            age, uuid = persisted
+            self._remember_name(key, uuid, age)
+            return uuid
+        if not is_player_name(name):
+            self._remember_name(key, None)
+            return None
+        return await asyncio.shield(self._enqueue_name(key))
+
+    def _enqueue_name(self, key: str) -> asyncio.Future[Optional[str]]:
+        future = self._pending_name_resolutions.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_name_resolutions[key] = future
+        if len(self._pending_name_resolutions) >= MOJANG_BATCH_SIZE:
+            self._flush_pending_names()
+        elif self._name_flush_timer is None:
+            self._name_flush_timer = loop.call_later(
+                MOJANG_BATCH_DELAY_SECONDS, self._flush_pending_names
+            )
+        return future
+
+    def _flush_pending_names(self) -> None:
+        if self._name_flush_timer is not None:
+            self._name_flush_timer.cancel()
+            self._name_flush_timer = None
+        batch = self._pending_name_resolutions
+        self._pending_name_resolutions = {}
+        if batch:
+            self._spawn(self._resolve_name_batch(batch))
+
+    async def _resolve_name_batch(
+        self, batch: dict[str, asyncio.Future[Optional[str]]]
+    ) -> None:
+        try:
+            resolved = await fetch_uuids_for_names(self.http_session, list(batch))
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for key, future in batch.items():
+            uuid = resolved.get(key)
+            self._remember_name(key, uuid)
+            self._spawn(self._persist_name(key, uuid))
+            if not future.done():
+                future.set_result(uuid)
+
+    def _remember_name(self, key: str, uuid: Optional[str], age: float = 0.0) -> None:
+        ttl = NAME_CACHE_TTL_SECONDS if uuid else NAME_CACHE_MISS_TTL_SECONDS
+        self._name_cache[key] = (time.monotonic() + ttl - age, uuid)
+        self._name_cache.move_to_end(key)
+        while len(self._name_cache) > NAME_CACHE_MAX_ENTRIES:
+            self._name_cache.popitem(last=False)
+
+    async def _load_persisted_name(
+        self, key: str
+    ) -> Optional[tuple[float, Optional[str]]]:
+        if self._name_db is None:
+            return None
+        try:
+            async with self._name_db.execute(
+                "SELECT uuid, fetched_at FROM name_uuid WHERE name = ?", (key,)
+            ) as cursor:
+                row = await cursor.fetchone()
+        except (aiosqlite.Error, ValueError):
+            self.logger.exception("Falha ao ler o cache de nomes")
+            return None
+        if row is None:
+            return None
+        uuid, fetched_at = row
+        age = time.time() - fetched_at
+        ttl = NAME_CACHE_TTL_SECONDS if uuid else NAME_CACHE_MISS_TTL_SECONDS
+        if age >= ttl:
+            return None
+        return age, uuid
+
+    async def _persist_name(self, key: str, uuid: Optional[str]) -> None:
+        if self._name_db is None:
+            return
+        try:
+            await self._name_db.execute(
+                "INSERT OR REPLACE INTO name_uuid (name, uuid, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (key, uuid, int(time.time())),
+            )
+            await self._name_db.commit()
+        except (aiosqlite.Error, ValueError):
+            self.logger.exception("Falha ao gravar o cache de nomes")
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _cached_status(self, key: str) -> Optional[ServerStatus]:
+        cached = self._status_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, status = cached
+        if expires_at <= time.monotonic():
+            return None
+        return status
+
+    async def fetch_server_status(self, address: str) -> ServerStatus:
+        key = address.lower()
+        status = self._cached_status(key)
+        if status is not None:
+            return status
+        lock = self._status_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            status = self._cached_status(key)
+            if status is not None:
+                return status
+            payload = await self._resilient_fetch(key, address)
+            status = summarize_status(payload)
+            self._status_cache[key] = (
+                time.monotonic() + STATUS_CACHE_TTL_SECONDS,
+                status,
+            )
+        return status
+
+    async def _resilient_fetch(self, key: str, address: str) -> dict[str, Any]:
+        failures, open_until = self._breaker_state.get(key, (0, 0.0))
+        if open_until > time.monotonic():
+            return {"online": False}
+        attempt = 1
+        while True:
+            try:
+                payload = await fetch_server_status(self.http_session, address)
+            except FETCH_ERRORS as error:
+                if attempt < STATUS_FETCH_ATTEMPTS and is_transient_error(error):
+                    attempt += 1
+                    await asyncio.sleep(random.uniform(*STATUS_RETRY_DELAY_SECONDS))
+                    continue
+                self._record_failure(key, address, failures + 1)
+                raise
+            self._breaker_state.pop(key, None)
+            return payload
+
+    def _record_failure(self, key: str, address: str, failures: int) -> None:
+        open_until = 0.0
+        if failures >= BREAKER_FAILURE_THRESHOLD:
+            open_until = time.monotonic() + BREAKER_OPEN_SECONDS
+            self.logger.warning(
+                "Servidor %s ignorado por %ss após %s falhas seguidas",
+                address,
+                BREAKER_OPEN_SECONDS,
+                failures,
+            )
+        self._breaker_state[key] = (failures, open_until)
+
+    async def find_player_servers(
+        self,
+        targets: list[ServerTarget],
+        player_name: str,
+        player_uuid: Optional[str],
+    ) -> tuple[list[ServerTarget], list[tuple[ServerTarget, ServerStatus]]]:
+        matches: list[ServerTarget] = []
+        checked: list[tuple[ServerTarget, ServerStatus]] = []
+        target_name = player_name.lower()
+        target_uuid = normalize_uuid(player_uuid) if player_uuid else None
+
+        async def check_server(target: ServerTarget) -> bool:
+            await self._admission.acquire()
+            try:
+                status = await self.fetch_server_status(target.address)
+            except FETCH_ERRORS:
+                return False
+            finally:
+                await self._admission.release()
+            checked.append((target, status))
+            if not status_has_player(status, target_name, target_uuid):
+                return False
+            matches.append(target)
+            return True
+
+        pending = iter(targets)
+
+        async def worker() -> None:
+            for target in pending:
+                if await check_server(target) and self.config.stop_on_first_match:
+                    current = asyncio.current_task()
+                    for task in workers:
+                        if task is not current:
+                            task.cancel()
+                    return
+
+        workers: list[asyncio.Task[None]] = []
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(len(targets), self._admission.limit)):
+                workers.append(group.create_task(worker()))
+        return matches, checked
+
+    def match_cached_servers(
+        self,
+        targets: list[ServerTarget],
+        player_name: Optional[str],
+        player_uuid: Optional[str],
+    ) -> tuple[list[ServerTarget], bool]:
+        target_name = player_name.lower() if player_name else None
+        target_uuid = normalize_uuid(player_uuid) if player_uuid else None
+        matches: list[ServerTarget] = []
+        complete = True
+        for target in targets:
+            status = self._cached_status(target.address.lower())
+            if status is None:
+                complete = False
+            elif status_has_player(status, target_name, target_uuid):
+                matches.append(target)
+        return matches, complete
 
     async def setup_hook(self) -> None:
-        self.http_session = aiohttp.ClientSession(timeout=self.http_timeout)
+        connector = aiohttp.TCPConnector(
+            resolver=aiohttp.AsyncResolver(),
+            limit=self.config.max_concurrency * 2,
+            limit_per_host=self.config.max_concurrency,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        self.http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.http_timeout,
+            headers={"User-Agent": USER_AGENT},
+        )
+        self._name_db = await aiosqlite.connect(self.config.name_cache_path)
+        await self._name_db.execute("PRAGMA journal_mode=WAL")
+        await self._name_db.execute(
+            "CREATE TABLE IF NOT EXISTS name_uuid "
+            "(name TEXT PRIMARY KEY, uuid TEXT, fetched_at INTEGER)"
+        )
+        await self._name_db.commit()
         await self.tree.sync()
 
     async def close(self) -> None:
+        if self._name_flush_timer is not None:
+            self._name_flush_timer.cancel()
+            self._name_flush_timer = None
+        pending = self._pending_name_resolutions
+        self._pending_name_resolutions = {}
+        for future in pending.values():
+            future.cancel()
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self._name_db:
+            await self._name_db.close()
         if self.http_session:
             await self.http_session.close()
         await super().close()
@@ -169,6 +577,51 @@ async def on_ready() -> None:
     bot.logger.info("Bot conectado como %s (ID: %s)", bot.user, bot.user.id)
 
 
+def search_reply(
+    jogador: str, matches: list[ServerTarget], player_known: bool = True
+) -> dict[str, Any]:
+    if not player_known:
+        return {
+            "content": f"Jogador `{jogador}` não encontrado na Mojang.",
+            "ephemeral": True,
+        }
+    if not matches:
+        return {
+            "content": (
+                "Nenhum servidor cristão configurado indicou esse jogador online."
+            ),
+            "ephemeral": True,
+        }
+    embed = discord.Embed.from_dict(
+        {
+            "title": "Jogador encontrado",
+            "description": "Encontrei o jogador nos servidores abaixo:",
+            "color": discord.Color.green().value,
+            "fields": server_fields(matches),
+        }
+    )
+    return {"embed": embed}
+
+
+def try_fast_path(jogador: str) -> Optional[dict[str, Any]]:
+    servers = bot.config.servers
+    if is_uuid(jogador):
+        matches, complete = bot.match_cached_servers(servers, jogador, jogador)
+        return search_reply(jogador, matches) if complete else None
+    matches, complete = bot.match_cached_servers(servers, jogador, None)
+    if not complete:
+        return None
+    if matches:
+        return search_reply(jogador, matches)
+    known, player_uuid = bot.cached_uuid(jogador)
+    if not known:
+        return None
+    if player_uuid is None:
+        return search_reply(jogador, [], player_known=False)
+    matches, _ = bot.match_cached_servers(servers, None, player_uuid)
+    return search_reply(jogador, matches)
+
+
 @bot.tree.command(
     name="procurar",
     description="Procura em quais servidores cristãos um jogador está online.",
@@ -190,49 +643,37 @@ async def procurar(interaction: discord.Interaction, jogador: str) -> None:
         )
         return
 
-    await interaction.response.defer(thinking=True)
+    reply = try_fast_path(jogador)
+    if reply is not None:
+        await interaction.response.send_message(**reply)
+        return
 
-    player_name = jogador
-    player_uuid = None
+    await interaction.response.defer(thinking=True)
 
-    if UUID_REGEX.match(jogador):
-        player_uuid = jogador
+    player_known = True
+    if is_uuid(jogador):
+        matches, _ = await bot.find_player_servers(
+            bot.config.servers,
+            player_name=jogador,
+            player_uuid=jogador,
+        )
     else:
-        player_uuid = await fetch_uuid_for_name(bot.http_session, jogador)
-        if player_uuid is None:
-            await interaction.followup.send(
-                f"Jogador `{jogador}` não encontrado na Mojang.",
-                ephemeral=True,
-            )
-            return
-
-    matches = await find_player_servers(
-        bot.http_session,
-        bot.config.servers,
-        player_name=player_name,
-        player_uuid=player_uuid,
-        max_concurrency=bot.config.max_concurrency,
-    )
-
-    if not matches:
-        await interaction.followup.send(
-            "Nenhum servidor cristão configurado indicou esse jogador online.",
-            ephemeral=True,
+        uuid_task = asyncio.create_task(bot.resolve_uuid(jogador))
+        matches, checked = await bot.find_player_servers(
+            bot.config.servers,
+            player_name=jogador,
+            player_uuid=None,
         )
-        return
+        if matches:
+            uuid_task.cancel()
+        else:
+            player_uuid = await uuid_task
+            if player_uuid is None:
+                player_known = False
+            else:
+                matches = servers_with_player(checked, player_uuid)
 
-    embed = discord.Embed(
-        title="Jogador encontrado",
-        description="Encontrei o jogador nos servidores abaixo:",
-        color=discord.Color.green(),
-    )
-    for server in matches:
-        embed.add_field(
-            name=server.name,
-            value=f"Endereço: `{server.address}`",
-            inline=False,
-        )
-    await interaction.followup.send(embed=embed)
+    await interaction.followup.send(**search_reply(jogador, matches, player_known))
 
 
 @bot.tree.command(
@@ -246,16 +687,7 @@ async def servidores(interaction: discord.Interaction) -> None:
             ephemeral=True,
         )
         return
-    embed = discord.Embed(
-        title="Servidores configurados",
-        color=discord.Color.blue(),
-    )
-    for server in bot.config.servers:
-        embed.add_field(
-            name=server.name,
-            value=f"Endereço: `{server.address}`",
-            inline=False,
-        )
+    embed = discord.Embed.from_dict(bot.servers_embed)
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 